@@ -192,6 +192,86 @@ async def test_acquire_timeout():
     await e.close()
 
 
+# noinspection PyProtectedMember
+async def test_acquire_timeout_in_init():
+    e = await create_engine(MYSQL_URL, minsize=1, maxsize=1)
+    init_size = qsize(e)
+    conns = []
+
+    async def slow_init(conn):
+        conns.append(conn)
+        await asyncio.sleep(1)
+
+    e._pool._conn_init = slow_init
+    with pytest.raises(asyncio.TimeoutError):
+        await e.acquire(timeout=0.1)
+    # let the cancelled acquisition clean up on Python < 3.7
+    await asyncio.sleep(0.01)
+    assert len(conns) == 1
+    assert conns[0].closed
+    assert len(e.raw_pool._used) == 0
+
+    e._pool._conn_init = None
+    async with e.acquire() as conn:
+        assert conn.raw_connection is not conns[0]
+    assert qsize(e) == init_size
+    await e.close()
+
+
+async def test_unfair_acquire():
+    e = await create_engine(MYSQL_URL, minsize=1, maxsize=1, fair=False)
+    loop = asyncio.get_event_loop()
+    order = []
+
+    async def waiter(i):
+        async with e.acquire() as conn:
+            order.append(i)
+            assert await conn.scalar("select 1") == 1
+
+    async with e.acquire():
+        tasks = [loop.create_task(waiter(i)) for i in range(3)]
+        await asyncio.sleep(0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            async with e.acquire(timeout=0.1):
+                assert False, "Should not reach here"  # pragma: no cover
+    await asyncio.gather(*tasks)
+    assert order == [2, 1, 0]
+    await e.close()
+
+
+# noinspection PyProtectedMember
+async def test_unfair_cancel_release():
+    e = await create_engine(MYSQL_URL, minsize=1, maxsize=1, fair=False)
+    loop = asyncio.get_event_loop()
+
+    async def acquire():
+        return await e.acquire()
+
+    conn = await e.acquire()
+    waiter = loop.create_task(acquire())
+    await asyncio.sleep(0.1)
+    assert not waiter.done()
+
+    # block the release on a pending prefetch and cancel it there
+    raw_conn = conn.raw_connection
+    prefetch = raw_conn._gino_prefetch = loop.create_future()
+    release = loop.create_task(conn.release())
+    await asyncio.sleep(0.1)
+    release.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await release
+    # the connection was left with a reader on it
+    assert prefetch.cancelled()
+    assert raw_conn.closed
+
+    # the slot is still passed on to the waiting acquirer
+    conn = await asyncio.wait_for(waiter, 1)
+    assert await conn.scalar("select 1") == 1
+    await conn.release()
+    assert e._pool._reserved == 0
+    await e.close()
+
+
 # noinspection PyProtectedMember
 async def test_lazy(mocker):
     engine = await create_engine(MYSQL_URL, minsize=1, maxsize=1)
@@ -88,3 +88,20 @@ async def test_basic(engine, names):
         assert names != result
         result.update([u.nickname for u in await cursor.many(2)])
         assert names == result
+
+
+# noinspection PyUnusedLocal,PyShadowingNames
+async def test_prefetch(engine, names):
+    async with engine.transaction() as tx:
+        conn = tx.connection
+        cursor = await conn.iterate(User.query)
+        result = {u.nickname for u in await cursor.many(2)}
+        assert len(result) == 2
+        # the last row is being prefetched, the query must wait for it
+        assert await conn.scalar(db.select([db.func.count(User.id)])) == 3
+        rows = await cursor.many(2)
+        assert len(rows) == 1
+        result.add(rows[0].nickname)
+        assert names == result
+        assert await cursor.many(2) == []
+        assert await cursor.next() is None
@@ -1,6 +1,7 @@
 import pytest
 
-from .models import db, User, qsize
+from gino import create_engine
+from .models import db, User, MYSQL_URL, qsize
 
 pytestmark = pytest.mark.asyncio
 
@@ -263,3 +264,32 @@ async def test_no_rollback_on_commit_fail(engine, mocker):
         with pytest.raises(IndexError):
             await tx.__aexit__(None, None, None)
         assert not rollback.called
+
+
+# noinspection PyProtectedMember
+async def test_lazy_begin(bind):
+    async with bind.acquire() as conn:
+        async with conn.transaction():
+            # BEGIN is sent immediately by default
+            assert conn.raw_connection.get_transaction_status()
+
+    e = await create_engine(MYSQL_URL, lazy_begin=True)
+    async with e.acquire() as conn:
+        raw_conn = conn.raw_connection
+        async with conn.transaction():
+            assert raw_conn._gino_begin_pending
+            assert not raw_conn.get_transaction_status()
+            assert await conn.scalar("SELECT 1") == 1
+            assert not raw_conn._gino_begin_pending
+            assert raw_conn.get_transaction_status()
+        assert not raw_conn.get_transaction_status()
+
+        # empty transactions don't hit the database at all
+        async with conn.transaction():
+            pass
+        assert not raw_conn._gino_begin_pending
+
+        # BEGIN is sent immediately with an explicit isolation level
+        async with conn.transaction(isolation="READ COMMITTED"):
+            assert raw_conn.get_transaction_status()
+    await e.close()
@@ -27,6 +27,24 @@ def create_engine(*args, **kwargs):
          time.
 
        Note: ``prebake`` has no effect in aiomysql
+
+    .. versionchanged:: 1.1
+       Added the ``prepared_statement_cache_size`` keyword argument (default 500) to
+       limit the statements cached by :meth:`~.engine.GinoConnection.prepare` in each
+       asyncpg connection. Caching is disabled with ``0``, or when asyncpg's own
+       ``statement_cache_size`` is ``0`` (e.g. behind pgbouncer).
+
+    .. versionchanged:: 1.1
+       Added the ``fair`` keyword argument for aiomysql. By default (``True``),
+       connections are handed out in the order they were requested. With
+       ``fair=False``, the latest waiter gets the next released connection, which
+       reduces the wake-up churn in a saturated pool at the cost of fairness.
+
+    .. versionchanged:: 1.1
+       Added the ``lazy_begin`` keyword argument for aiomysql. With
+       ``lazy_begin=True``, ``BEGIN`` is sent together with the first statement of
+       a transaction, saving one round-trip. Statements sent on the raw connection
+       before that run outside of the transaction. It's ``False`` by default.
     """
 
     from sqlalchemy import create_engine
@@ -1,4 +1,6 @@
 import asyncio
+import collections
+import functools
 import inspect
 import itertools
 import re
@@ -6,6 +8,7 @@ import time
 import warnings
 
 import aiomysql
+from pymysql.constants import CLIENT
 from sqlalchemy import util, exc
 from sqlalchemy.dialects.mysql import JSON, ENUM
 from sqlalchemy.dialects.mysql.base import (
@@ -33,6 +36,10 @@ _RE_INSERT_VALUES = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+#: Regular expressions for :meth:`AiomysqlDialect._parse_server_version`.
+_RE_VERSION_SPLIT = re.compile(r"[.\-]")
+_RE_MARIADB = re.compile(r"(.*)(MariaDB)(.*)")
+
 #: Max statement size which :meth:`executemany` generates.
 #:
 #: Max size of allowed statement is max_allowed_packet -
@@ -40,6 +47,9 @@ _RE_INSERT_VALUES = re.compile(
 #: Default value of max_allowed_packet is 1048576.
 _MAX_STMT_LENGTH = 1024000
 
+#: Number of rows :class:`AiomysqlIterator` fetches at a time when iterating.
+_ITERATOR_PREFETCH = 256
+
 
 class AiomysqlDBAPI(base.BaseDBAPI):
     paramstyle = "format"
@@ -60,6 +70,9 @@ class AiomysqlIterator(base.Cursor):
         self._context = context
         self._cursor = cursor
         self._queried = False
+        # rows fetched ahead, already processed by SQLAlchemy but not loaded
+        self._buffer = collections.deque()
+        self._prefetch = None
 
     def __await__(self):
         async def return_self():
@@ -74,25 +87,48 @@ class AiomysqlIterator(base.Cursor):
         if not self._queried:
             query = self._context.statement
             args = self._context.parameters[0]
+            await _wait_prefetch(self._cursor.connection)
+            await _flush_begin(self._cursor.connection)
             await self._cursor.execute(query, args)
             self._context.cursor._cursor_description = self._cursor.description
             self._queried = True
+        elif self._prefetch is not None:
+            prefetch, self._prefetch = self._prefetch, None
+            await _wait_prefetch(self._cursor.connection)
+            self._buffer.extend(prefetch.result())
+
+    async def _fetch(self, n, timeout):
+        rows = await asyncio.wait_for(self._cursor.fetchmany(n), timeout)
+        return self._context.process_rows(rows, return_model=False)
 
     async def __anext__(self):
         await self._init()
-        row = await asyncio.wait_for(self._cursor.fetchone(), self._context.timeout)
-        if row is None:
-            raise StopAsyncIteration
-        return self._context.process_rows([row])[0]
+        if not self._buffer:
+            self._buffer.extend(
+                await self._fetch(_ITERATOR_PREFETCH, self._context.timeout)
+            )
+            if not self._buffer:
+                raise StopAsyncIteration
+        # noinspection PyProtectedMember
+        return self._context._load_rows([self._buffer.popleft()])[0]
 
     async def many(self, n, *, timeout=base.DEFAULT):
         await self._init()
         if timeout is base.DEFAULT:
             timeout = self._context.timeout
-        rows = await asyncio.wait_for(self._cursor.fetchmany(n), timeout)
+        rows = []
+        while self._buffer and len(rows) < n:
+            rows.append(self._buffer.popleft())
+        if len(rows) < n:
+            rows.extend(await self._fetch(n - len(rows), timeout))
+        if rows and len(rows) == n:
+            # read the next batch while the caller is working on this one
+            self._prefetch = asyncio.ensure_future(self._fetch(n, timeout))
+            self._cursor.connection._gino_prefetch = self._prefetch
         if not rows:
             return []
-        return self._context.process_rows(rows)
+        # noinspection PyProtectedMember
+        return self._context._load_rows(rows)
 
     async def next(self, *, timeout=base.DEFAULT):
         try:
@@ -104,10 +140,22 @@ class AiomysqlIterator(base.Cursor):
         await self._init()
         if timeout is base.DEFAULT:
             timeout = self._context.timeout
-        await asyncio.wait_for(self._cursor.scroll(n, mode="relative"), timeout)
+        while self._buffer and n > 0:
+            self._buffer.popleft()
+            n -= 1
+        if n:
+            await asyncio.wait_for(self._cursor.scroll(n, mode="relative"), timeout)
 
 
 class DBAPICursor(base.DBAPICursor):
+    __slots__ = (
+        "_conn",
+        "_cursor_description",
+        "_status",
+        "last_row_id",
+        "affected_rows",
+    )
+
     def __init__(self, dbapi_conn):
         self._conn = dbapi_conn
         self._cursor_description = None
@@ -139,15 +187,17 @@ class DBAPICursor(base.DBAPICursor):
         return await self.async_execute(baked_query.sql, timeout, args)
 
     async def _async_execute(self, conn, query, timeout, args):
+        await _wait_prefetch(conn)
         if args is not None:
             query = query % _escape_args(args, conn)
-        await asyncio.wait_for(conn.query(query), timeout=timeout)
+        await asyncio.wait_for(_query(conn, query), timeout=timeout)
         # noinspection PyProtectedMember
         result = conn._result
+        affected_rows = result.affected_rows
         self._cursor_description = result.description
-        self._status = result.affected_rows
+        self._status = affected_rows
         self.last_row_id = result.insert_id
-        self.affected_rows = result.affected_rows
+        self.affected_rows = affected_rows
         return result.rows
 
     async def _async_executemany(self, conn, query, args):
@@ -168,20 +218,19 @@ class DBAPICursor(base.DBAPICursor):
         return None
 
     async def _do_execute_many(self, conn, prefix, values, postfix, args):
-        escape = _escape_args
         if isinstance(prefix, str):
             prefix = prefix.encode(conn.encoding)
         if isinstance(postfix, str):
             postfix = postfix.encode(conn.encoding)
         stmt = bytearray(prefix)
         args = iter(args)
-        v = values % escape(next(args), conn)
+        v = values % _escape_args(next(args), conn)
         if isinstance(v, str):
             v = v.encode(conn.encoding, "surrogateescape")
         stmt += v
         rows = 0
         for arg in args:
-            v = values % escape(arg, conn)
+            v = values % _escape_args(arg, conn)
             if isinstance(v, str):
                 v = v.encode(conn.encoding, "surrogateescape")
             if len(stmt) + len(v) + len(postfix) + 1 > _MAX_STMT_LENGTH:
@@ -207,7 +256,9 @@ class DBAPICursor(base.DBAPICursor):
 
 
 class Pool(base.Pool):
-    def __init__(self, url, loop, init=None, bakery=None, prebake=True, **kwargs):
+    def __init__(
+        self, url, loop, init=None, bakery=None, prebake=True, fair=True, **kwargs
+    ):
         self._url = url
         self._loop = loop
         self._kwargs = kwargs
@@ -215,6 +266,11 @@ class Pool(base.Pool):
         self._conn_init = init
         self._bakery = bakery
         self._prebake = prebake
+        self._fair = fair
+        # connections taken or being taken from the pool, and the LIFO stack of
+        # waiters for a free slot, only used when not being fair
+        self._reserved = 0
+        self._waiters = collections.deque()
 
     async def _init(self):
         args = self._kwargs.copy()
@@ -241,19 +297,85 @@ class Pool(base.Pool):
 
     async def acquire(self, *, timeout=None):
         if timeout is None:
+            return await self._acquire()
+        # the timeout covers both the acquisition and the init hook
+        return await asyncio.wait_for(self._acquire(), timeout=timeout)
+
+    async def _acquire(self):
+        if self._fair:
             conn = await self._pool.acquire()
         else:
-            conn = await asyncio.wait_for(self._pool.acquire(), timeout=timeout)
+            await self._reserve()
+            try:
+                conn = await self._pool.acquire()
+            except:
+                self._unreserve()
+                raise
         if self._conn_init is not None:
             try:
                 await self._conn_init(conn)
+            except asyncio.CancelledError:
+                # timed out or cancelled in the middle of a query, the connection
+                # is in an unknown state and cannot be reused
+                conn.close()
+                await self.release(conn)
+                raise
             except:
                 await self.release(conn)
                 raise
         return conn
 
+    async def _reserve(self):
+        maxsize = self._pool.maxsize
+        while maxsize and self._reserved >= maxsize:
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except:
+                if waiter.cancelled():
+                    try:
+                        self._waiters.remove(waiter)
+                    except ValueError:
+                        pass
+                else:
+                    # woken up but cancelled before resuming, pass the slot on
+                    self._wakeup()
+                raise
+        self._reserved += 1
+
+    def _unreserve(self):
+        self._reserved -= 1
+        self._wakeup()
+
+    def _wakeup(self):
+        # the latest waiter wins instead of the one waiting for the longest time
+        while self._waiters:
+            waiter = self._waiters.pop()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
     async def release(self, conn):
-        await self._pool.release(conn)
+        try:
+            try:
+                await _wait_prefetch(conn)
+            except Exception:
+                # the connection was left in the middle of a result
+                conn.close()
+            except BaseException:
+                conn.close()
+                raise
+            finally:
+                if getattr(conn, "_gino_begin_pending", False):
+                    # the transaction was left without any statement
+                    conn._gino_begin_pending = False
+                # always return the connection, even if cancelled while waiting
+                released = self._pool.release(conn)
+            await released
+        finally:
+            if not self._fair:
+                self._unreserve()
 
     async def close(self):
         self._pool.close()
@@ -291,23 +413,45 @@ class Pool(base.Pool):
 
 
 class Transaction(base.Transaction):
-    def __init__(self, conn, set_isolation=None):
+    def __init__(self, conn, set_isolation=None, lazy_begin=False):
         self._conn = conn
         self._set_isolation = set_isolation
+        self._lazy_begin = lazy_begin
 
     @property
     def raw_transaction(self):
         return self._conn
 
     async def begin(self):
-        await self._conn.begin()
+        conn = self._conn
+        await _wait_prefetch(conn)
+        if (
+            self._lazy_begin
+            and self._set_isolation is None
+            and conn.client_flag & CLIENT.MULTI_STATEMENTS
+            and conn.get_autocommit()
+            and not conn.get_transaction_status()
+        ):
+            # defer BEGIN to be sent together with the first statement
+            conn._gino_begin_pending = True
+            return
+        await conn.begin()
         if self._set_isolation is not None:
-            await self._set_isolation(self._conn)
+            await self._set_isolation(conn)
 
     async def commit(self):
+        await _wait_prefetch(self._conn)
+        if getattr(self._conn, "_gino_begin_pending", False):
+            # nothing was executed in this transaction
+            self._conn._gino_begin_pending = False
+            return
         await self._conn.commit()
 
     async def rollback(self):
+        await _wait_prefetch(self._conn)
+        if getattr(self._conn, "_gino_begin_pending", False):
+            self._conn._gino_begin_pending = False
+            return
         await self._conn.rollback()
 
 
@@ -347,17 +491,6 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
     statement_compiler = MySQLCompiler
     execution_ctx_cls = AiomysqlExecutionContext
     cursor_cls = DBAPICursor
-    init_kwargs = set(
-        itertools.chain(
-            ("bakery", "prebake"),
-            *[
-                inspect.getfullargspec(f).args
-                for f in [aiomysql.create_pool, aiomysql.connect]
-            ]
-        )
-    ) - {
-        "echo"
-    }  # use SQLAlchemy's echo instead
     colspecs = util.update_copy(
         MySQLDialect.colspecs,
         {ENUM: AsyncEnum, sqltypes.Enum: AsyncEnum, sqltypes.NullType: GinoNullType,},
@@ -366,11 +499,14 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
     support_returning = False
     support_prepare = False
 
-    def __init__(self, *args, bakery=None, **kwargs):
-        self._pool_kwargs = {}
-        for k in self.init_kwargs:
-            if k in kwargs:
-                self._pool_kwargs[k] = kwargs.pop(k)
+    # noinspection PyMethodParameters
+    @util.classproperty
+    def init_kwargs(cls):
+        return _init_kwargs()
+
+    def __init__(self, *args, bakery=None, lazy_begin=False, **kwargs):
+        self._pool_kwargs = {k: kwargs.pop(k) for k in self.init_kwargs & kwargs.keys()}
+        self._lazy_begin = lazy_begin
         super().__init__(*args, **kwargs)
         self._init_mixin(bakery)
 
@@ -389,7 +525,7 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
             async def _set_isolation(conn):
                 await self.set_isolation_level(conn, kwargs["isolation"])
 
-        return Transaction(raw_conn, _set_isolation)
+        return Transaction(raw_conn, _set_isolation, self._lazy_begin)
 
     def on_connect(self):
         if self.isolation_level is not None:
@@ -412,12 +548,22 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
                 "Valid isolation levels for %s are %s"
                 % (level, self.name, ", ".join(self._isolation_lookup))
             )
+        await _wait_prefetch(connection)
         cursor = await connection.cursor()
-        await cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL %s" % level)
-        await cursor.execute("COMMIT")
+        if connection.client_flag & CLIENT.MULTI_STATEMENTS:
+            # send both in one round-trip, closing the cursor reads the other result
+            await cursor.execute(
+                "SET SESSION TRANSACTION ISOLATION LEVEL %s; COMMIT" % level
+            )
+        else:
+            await cursor.execute("SET SESSION TRANSACTION ISOLATION LEVEL %s" % level)
+            await cursor.execute("COMMIT")
         await cursor.close()
 
     async def get_isolation_level(self, connection):
+        await _wait_prefetch(connection)
+        # read the level within the transaction if its BEGIN is deferred
+        await _flush_begin(connection)
         if self.server_version_info is None:
             self.server_version_info = await self._get_server_version_info(connection)
         cursor = await connection.cursor()
@@ -442,6 +588,7 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
         # get database server version info explicitly over the wire
         # to avoid proxy servers like MaxScale getting in the
         # way with their own values, see #4205
+        await _wait_prefetch(connection)
         cursor = await connection.cursor()
         await cursor.execute("SELECT VERSION()")
         val = (await cursor.fetchone())[0]
@@ -452,13 +599,16 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
         return self._parse_server_version(val)
 
     def _parse_server_version(self, val):
+        try:
+            return tuple(int(n) for n in val.split("."))
+        except ValueError:
+            pass
         version = []
-        r = re.compile(r"[.\-]")
-        for n in r.split(val):
+        for n in _RE_VERSION_SPLIT.split(val):
             try:
                 version.append(int(n))
             except ValueError:
-                mariadb = re.match(r"(.*)(MariaDB)(.*)", n)
+                mariadb = _RE_MARIADB.match(n)
                 if mariadb:
                     version.extend(g for g in mariadb.groups() if g)
                 else:
@@ -484,11 +634,68 @@ class AiomysqlDialect(MySQLDialect, base.AsyncDialectMixin):
         return exception.args[0]
 
 
+async def _wait_prefetch(conn):
+    # an iterator may still be reading its next batch in the background, let it
+    # finish before the connection is used for anything else
+    prefetch = getattr(conn, "_gino_prefetch", None)
+    if prefetch is None:
+        return
+    try:
+        await asyncio.wait([prefetch])
+    except asyncio.CancelledError:
+        # the prefetch would be left reading from the socket, stop it and close the
+        # connection so that it's never used again
+        prefetch.cancel()
+        conn.close()
+        raise
+    if getattr(conn, "_gino_prefetch", None) is prefetch:
+        conn._gino_prefetch = None
+    if not prefetch.cancelled():
+        # the connection is unusable if the prefetch failed, re-raise its error
+        prefetch.result()
+
+
+async def _flush_begin(conn):
+    if getattr(conn, "_gino_begin_pending", False):
+        conn._gino_begin_pending = False
+        await conn.begin()
+
+
+async def _query(conn, query):
+    if getattr(conn, "_gino_begin_pending", False):
+        conn._gino_begin_pending = False
+        if isinstance(query, str):
+            query = "BEGIN;" + query
+        else:
+            query = b"BEGIN;" + query
+        await conn.query(query)
+        # skip the result of BEGIN
+        await conn.next_result()
+    else:
+        await conn.query(query)
+
+
+@functools.lru_cache()
+def _init_kwargs():
+    return frozenset(
+        itertools.chain(
+            ("bakery", "prebake", "fair", "lazy_begin"),
+            *[
+                inspect.getfullargspec(f).args
+                for f in [aiomysql.create_pool, aiomysql.connect]
+            ]
+        )
+    ) - {
+        "echo"
+    }  # use SQLAlchemy's echo instead
+
+
 def _escape_args(args, conn):
     if isinstance(args, (tuple, list)):
-        return tuple(conn.escape(arg) for arg in args)
+        return tuple(map(conn.escape, args))
     elif isinstance(args, dict):
-        return dict((key, conn.escape(val)) for (key, val) in args.items())
+        escape = conn.escape
+        return {key: escape(val) for key, val in args.items()}
     else:
         # If it's not a dictionary let's try escaping it anyways.
         # Worst case it will throw a Value error
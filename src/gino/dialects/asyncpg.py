@@ -1,3 +1,4 @@
+import collections
 import inspect
 import itertools
 import time
@@ -29,6 +30,10 @@ except ImportError:
     click = None
 JSON_COLTYPE = 114
 JSONB_COLTYPE = 3802
+_INVALID_STATEMENT_ERRORS = (
+    asyncpg.exceptions.InvalidCachedStatementError,
+    asyncpg.exceptions.OutdatedSchemaCacheError,
+)
 
 
 class AsyncpgDBAPI(base.BaseDBAPI):
@@ -65,7 +70,12 @@ class AsyncpgExecutionContext(base.ExecutionContextOverride, PGExecutionContext)
         else:
             default_params = {}
 
-        conn._cursor_execute(self.cursor, stmt, default_params, context=self)
+        if conn._has_events or conn.engine._has_events or self.dialect._has_events:
+            conn._cursor_execute(self.cursor, stmt, default_params, context=self)
+        elif conn._echo:
+            # the only work left in _cursor_execute() as the cursor execute is no-op
+            conn.engine.logger.info(stmt)
+            conn.engine.logger.info("%r", default_params)
         r = await self.cursor.async_execute(stmt, None, default_params, 1)
         r = r[0][0]
         if type_ is not None:
@@ -79,12 +89,24 @@ class AsyncpgExecutionContext(base.ExecutionContextOverride, PGExecutionContext)
 
 
 class AsyncpgIterator:
-    def __init__(self, context, iterator):
+    def __init__(self, context, iterator, reprepare=None):
         self._context = context
         self._iterator = iterator
+        self._reprepare = reprepare
 
     async def __anext__(self):
-        row = await self._iterator.__anext__()
+        if self._reprepare is None:
+            row = await self._iterator.__anext__()
+        else:
+            # the statement is bound with the first row, retry once if invalidated
+            reprepare, self._reprepare = self._reprepare, None
+            try:
+                row = await self._iterator.__anext__()
+            except _INVALID_STATEMENT_ERRORS:
+                self._iterator = await reprepare()
+                if self._iterator is None:
+                    raise
+                row = await self._iterator.__anext__()
         return self._context.process_rows([row])[0]
 
 
@@ -117,17 +139,38 @@ class PreparedStatement(base.PreparedStatement):
     def __init__(self, prepared, clause=None):
         super().__init__(clause)
         self._prepared = prepared
+        self._conn = None
+        self._stmt_cache = None
 
     def _get_iterator(self, *params, **kwargs):
+        async def reprepare():
+            if await self._reprepare():
+                return self._prepared.cursor(*params, **kwargs).__aiter__()
+
         return AsyncpgIterator(
-            self.context, self._prepared.cursor(*params, **kwargs).__aiter__()
+            self.context,
+            self._prepared.cursor(*params, **kwargs).__aiter__(),
+            reprepare,
         )
 
     async def _get_cursor(self, *params, **kwargs):
-        iterator = await self._prepared.cursor(*params, **kwargs)
+        try:
+            iterator = await self._prepared.cursor(*params, **kwargs)
+        except _INVALID_STATEMENT_ERRORS:
+            if not await self._reprepare():
+                raise
+            iterator = await self._prepared.cursor(*params, **kwargs)
         return AsyncpgCursor(self.context, iterator)
 
     async def _execute(self, params, one):
+        try:
+            return await self._fetch(params, one)
+        except _INVALID_STATEMENT_ERRORS:
+            if not await self._reprepare():
+                raise
+            return await self._fetch(params, one)
+
+    async def _fetch(self, params, one):
         if one:
             rv = await self._prepared.fetchrow(*params)
             if rv is None:
@@ -138,14 +181,62 @@ class PreparedStatement(base.PreparedStatement):
             rv = await self._prepared.fetch(*params)
         return self._prepared.get_statusmsg(), rv
 
+    async def _reprepare(self):
+        # a cached statement is invalidated by e.g. schema changes, replace it in the
+        # cache and retry like asyncpg does, unless the transaction is aborted
+        if self._stmt_cache is None:
+            return False
+        query = self.context.statement
+        self._stmt_cache.discard(query)
+        if self._conn.is_in_transaction():
+            return False
+        self._prepared = await self._conn.prepare(query, timeout=self.context.timeout)
+        self._stmt_cache.put(query, self._prepared)
+        return True
+
+
+class _PreparedStatementCache:
+    """LRU cache of the asyncpg prepared statements of one connection."""
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._statements = collections.OrderedDict()
+
+    def get(self, query):
+        rv = self._statements.get(query)
+        if rv is not None:
+            self._statements.move_to_end(query)
+        return rv
+
+    def put(self, query, prepared):
+        self._statements[query] = prepared
+        self._statements.move_to_end(query)
+        while len(self._statements) > self._max_size:
+            # asyncpg closes the statement once it's garbage collected
+            self._statements.popitem(last=False)
+
+    def discard(self, query):
+        self._statements.pop(query, None)
+
+    def clear(self):
+        self._statements.clear()
+
+    def __len__(self):
+        return len(self._statements)
+
 
 class DBAPICursor(base.DBAPICursor):
     def __init__(self, dbapi_conn):
         self._conn = dbapi_conn
+        self._held_conn = None
         self._attributes = None
         self._status = None
 
     async def _acquire(self, timeout):
+        # a cursor lives within one execution context, reuse the raw connection
+        # for e.g. the default values, the statement and its prepared statement
+        if self._held_conn is not None:
+            return self._held_conn, timeout
         if timeout is None:
             conn = await self._conn.acquire(timeout=timeout)
         else:
@@ -153,17 +244,31 @@ class DBAPICursor(base.DBAPICursor):
             conn = await self._conn.acquire(timeout=timeout)
             after = time.monotonic()
             timeout -= after - before
+        self._held_conn = conn
         return conn, timeout
 
     async def prepare(self, context, clause=None):
         conn, timeout = await self._acquire(context.timeout)
-        prepared = await conn.prepare(context.statement, timeout=timeout)
+        cache = getattr(conn, "prepared_statements", None)
+        cached = None if cache is None else cache.get(context.statement)
+        if cached is None:
+            prepared = await conn.prepare(context.statement, timeout=timeout)
+            if cache is not None:
+                cache.put(context.statement, prepared)
+        else:
+            # share the server-side statement in a new object guarded by the current
+            # acquisition, the cached one may still be held by a previous borrower
+            prepared = asyncpg.prepared_stmt.PreparedStatement(
+                conn, context.statement, getattr(cached, "_state")
+            )
         try:
             self._attributes = prepared.get_attributes()
         except TypeError:  # asyncpg <= 0.12.0
             self._attributes = []
         rv = PreparedStatement(prepared, clause)
         rv.context = context
+        rv._conn = conn
+        rv._stmt_cache = cache
         return rv
 
     async def async_execute(self, query, timeout, args, limit=0, many=False):
@@ -225,7 +330,15 @@ class DBAPICursor(base.DBAPICursor):
 
 
 class Pool(base.Pool):
-    def __init__(self, url, loop, bakery=None, prebake=True, **kwargs):
+    def __init__(
+        self,
+        url,
+        loop,
+        bakery=None,
+        prebake=True,
+        prepared_statement_cache_size=500,
+        **kwargs
+    ):
         self._url = url
         self._loop = loop
         self._kwargs = kwargs
@@ -233,16 +346,26 @@ class Pool(base.Pool):
         self._bakery = bakery
         self._init_hook = None
         self._prebake = prebake
+        self._prepared_statement_cache_size = prepared_statement_cache_size
 
     async def _init(self):
         args = self._kwargs.copy()
+        cache_size = self._prepared_statement_cache_size
+        if args.get("statement_cache_size") == 0:
+            # statement caching is usually disabled for pgbouncer in transaction
+            # pooling mode, where prepared statements cannot be reused
+            cache_size = 0
 
         class Connection(args.pop("connection_class", asyncpg.Connection)):
-            __slots__ = ("baked_queries",)
+            __slots__ = ("baked_queries", "prepared_statements")
 
             def __init__(self, *pargs, **kwargs):
                 super().__init__(*pargs, **kwargs)
                 self.baked_queries = {}
+                if cache_size:
+                    self.prepared_statements = _PreparedStatementCache(cache_size)
+                else:
+                    self.prepared_statements = None
 
         args.update(
             loop=self._loop,
@@ -462,13 +585,19 @@ class GinoNullType(sqltypes.NullType):
 class AsyncpgJSONPathType(json.JSONPathType):
     def bind_processor(self, dialect):
         super_proc = self.string_bind_processor(dialect)
+        text_type = util.text_type
 
-        def process(value):
-            assert isinstance(value, util.collections_abc.Sequence)
-            if super_proc:
-                return [super_proc(util.text_type(elem)) for elem in value]
-            else:
-                return [util.text_type(elem) for elem in value]
+        if super_proc:
+
+            def process(value):
+                assert isinstance(value, util.collections_abc.Sequence)
+                return list(map(super_proc, map(text_type, value)))
+
+        else:
+
+            def process(value):
+                assert isinstance(value, util.collections_abc.Sequence)
+                return list(map(text_type, value))
 
         return process
 
@@ -483,7 +612,7 @@ class AsyncpgDialect(PGDialect, base.AsyncDialectMixin):
     cursor_cls = DBAPICursor
     init_kwargs = set(
         itertools.chain(
-            ("bakery", "prebake"),
+            ("bakery", "prebake", "prepared_statement_cache_size"),
             *[
                 inspect.getfullargspec(f).kwonlydefaults.keys()
                 for f in [asyncpg.create_pool, asyncpg.connect]
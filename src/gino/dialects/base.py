@@ -22,6 +22,8 @@ class BaseDBAPI:
 
 
 class DBAPICursor:
+    __slots__ = ()
+
     def execute(self, statement, parameters):
         pass
 
@@ -297,18 +299,23 @@ class ExecutionContextOverride:
         if not rows:
             return []
         # noinspection PyUnresolvedReferences
-        rv = rows = super().get_result_proxy().process_rows(rows)
+        rows = super().get_result_proxy().process_rows(rows)
+        return self._load_rows(rows, return_model)
+
+    def _load_rows(self, rows, return_model=True):
+        rv = rows
         loader = self.loader
         if loader is None and self.model is not None:
             loader = Loader.get(self.model)
         if loader is not None and return_model and self.return_model:
             ctx = {}
             rv = []
-            loader = Loader.get(loader)
+            append = rv.append
+            do_load = Loader.get(loader).do_load
             for row in rows:
-                obj, distinct = loader.do_load(row, ctx)
+                obj, distinct = do_load(row, ctx)
                 if distinct:
-                    rv.append(obj)
+                    append(obj)
         return rv
 
     def get_result_proxy(self):
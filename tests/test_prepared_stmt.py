@@ -1,7 +1,10 @@
 from datetime import datetime
 
+import asyncpg
 import pytest
-from .models import db, User
+
+import gino
+from .models import db, User, PG_URL
 
 pytestmark = pytest.mark.asyncio
 
@@ -45,3 +48,77 @@ async def test_statement(engine):
             assert isinstance(now, datetime)
             assert last != now
             last = now
+
+
+async def test_prepared_statement_cache(engine):
+    async with engine.acquire() as conn:
+        stmt1 = await conn.prepare("SELECT 1")
+        stmt2 = await conn.prepare("SELECT 1")
+        # noinspection PyProtectedMember
+        assert stmt1._prepared._state is stmt2._prepared._state
+        # noinspection PyProtectedMember
+        stmt2._stmt_cache.clear()
+        stmt3 = await conn.prepare("SELECT 1")
+        # noinspection PyProtectedMember
+        assert stmt3._prepared._state is not stmt1._prepared._state
+        assert await stmt1.scalar() == await stmt3.scalar() == 1
+
+
+async def test_prepared_statement_cache_size():
+    e = await gino.create_engine(PG_URL, prepared_statement_cache_size=1)
+    async with e.acquire() as conn:
+        one = await conn.prepare("SELECT 1")
+        two = await conn.prepare("SELECT 2")
+        # noinspection PyProtectedMember
+        assert len(two._stmt_cache) == 1
+        # noinspection PyProtectedMember
+        assert (await conn.prepare("SELECT 1"))._prepared is not one._prepared
+        assert await two.scalar() == 2
+    await e.close()
+
+    e = await gino.create_engine(PG_URL, statement_cache_size=0)
+    async with e.acquire() as conn:
+        stmt = await conn.prepare("SELECT 1")
+        # noinspection PyProtectedMember
+        assert stmt._stmt_cache is None
+        assert await stmt.scalar() == 1
+    await e.close()
+
+
+async def test_prepared_statement_cache_released():
+    e = await gino.create_engine(PG_URL, min_size=1, max_size=1)
+    async with e.acquire() as conn:
+        stmt = await conn.prepare("SELECT 1")
+    async with e.acquire() as conn:
+        again = await conn.prepare("SELECT 1")
+        # noinspection PyProtectedMember
+        assert again._prepared._state is stmt._prepared._state
+        # the statement of the previous acquisition is still unusable
+        with pytest.raises(asyncpg.InterfaceError, match="released back to the pool"):
+            await stmt.scalar()
+        assert await again.scalar() == 1
+    await e.close()
+
+
+async def test_prepared_statement_cache_invalidated(engine):
+    async with engine.acquire() as conn:
+        await conn.status("CREATE TEMP TABLE gino_stmt_cache (a int)")
+        stmt = await conn.prepare("SELECT * FROM gino_stmt_cache")
+        assert await stmt.all() == []
+        await conn.status("ALTER TABLE gino_stmt_cache ADD COLUMN b int")
+        stmt = await conn.prepare("SELECT * FROM gino_stmt_cache")
+        assert await stmt.all() == []
+        again = await conn.prepare("SELECT * FROM gino_stmt_cache")
+        # noinspection PyProtectedMember
+        assert again._prepared._state is stmt._prepared._state
+
+        await conn.status("ALTER TABLE gino_stmt_cache ADD COLUMN c int")
+        with pytest.raises(asyncpg.exceptions.InvalidCachedStatementError):
+            async with conn.transaction():
+                async for _ in again.iterate():
+                    pass  # pragma: no cover
+        # the invalidated statement is dropped from the cache by the iterator too
+        stmt = await conn.prepare("SELECT * FROM gino_stmt_cache")
+        # noinspection PyProtectedMember
+        assert stmt._prepared._state is not again._prepared._state
+        assert await stmt.all() == []